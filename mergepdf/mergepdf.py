@@ -12,33 +12,142 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
+import mmap
 import os
-from pathlib import Path
+import shutil
+import stat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from io import BytesIO
 
-try:
-    from PyPDF2 import PdfWriter, PdfReader
-except ImportError:
-    print("Error: PyPDF2 is required. Install it with: pip install PyPDF2")
-    sys.exit(1)
+# All heavy backends are imported lazily through cached probes below so a
+# plain --help (or a pure-PDF run) never pays for tkinter/Pillow/etc.
+# startup cost. Each probe returns the imported module (or None if it is
+# not installed) and caches the result, both here and in pool workers.
 
-# Optional: Pillow for image support (now required for image merging)
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
 
-try:
-    import tkinter as tk
-    from tkinter import filedialog, messagebox
-    GUI_AVAILABLE = True
-except ImportError:
-    GUI_AVAILABLE = False
+@lru_cache(maxsize=None)
+def _fitz():
+    """PyMuPDF, the preferred merge backend: it copies object streams
+    natively (C/MuPDF) instead of rebuilding the object graph in Python."""
+    try:
+        import fitz
+        return fitz
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _pypdf2():
+    """PyPDF2, the fallback merge backend."""
+    try:
+        import PyPDF2
+        return PyPDF2
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _pil():
+    """Pillow's Image module, required for the last-resort image path."""
+    try:
+        from PIL import Image
+        return Image
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _pyvips():
+    """pyvips (libvips): SIMD-tuned, multi-threaded resize that streams
+    tiles instead of decoding the whole bitmap."""
+    try:
+        import pyvips
+        return pyvips
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _cv2():
+    """OpenCV, whose INTER_AREA resize suits large downscales."""
+    try:
+        import cv2
+        return cv2
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """NumPy, used for vectorized canvas work in the OpenCV tier."""
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _reportlab():
+    """reportlab (Canvas, ImageReader): emits image pages directly as PDF,
+    embedding JPEGs as DCT streams without re-encoding."""
+    try:
+        from reportlab.pdfgen import canvas as rl_canvas
+        from reportlab.lib.utils import ImageReader
+        return rl_canvas, ImageReader
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _tkinter():
+    """tkinter (tk, filedialog, messagebox) for the GUI file selection."""
+    try:
+        import tkinter as tk
+        from tkinter import filedialog, messagebox
+        return tk, filedialog, messagebox
+    except ImportError:
+        return None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging(verbose: bool = False):
+    """Route progress output through a single stdout handler.
+
+    One handler means one buffered stream instead of a flush per print
+    call; this also runs as the process-pool initializer so worker
+    messages surface the same way as the parent's.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+
+SUPPORTED_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif", ".webp"})
 
 
-SUPPORTED_IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif", ".webp"}
+def _classify(path_str):
+    """Classify a path by extension without building a Path object.
+
+    os.path.splitext is markedly cheaper than Path(...).suffix, which
+    matters when validating thousands of paths in batch mode.
+
+    Returns:
+        tuple[str, str]: (kind, suffix) where kind is "pdf", "image" or "skip"
+    """
+    suffix = os.path.splitext(path_str)[1].casefold()
+    if suffix == ".pdf":
+        return "pdf", suffix
+    if suffix in SUPPORTED_IMAGE_EXTS:
+        return "image", suffix
+    return "skip", suffix
 
 # A4 sizing constants (we'll create 300 DPI pages so physical size is A4)
 A4_DPI = 300
@@ -46,81 +155,528 @@ A4_DPI = 300
 A4_WIDTH_PX = 2480  # could also be 2481 depending on rounding
 A4_HEIGHT_PX = 3508
 
+# A4 in PDF points (1/72 inch), used by the PyMuPDF page path
+A4_WIDTH_PT = 595
+A4_HEIGHT_PT = 842
 
-def merge_pdfs_and_images(input_files, output_file, image_size: str = "a4"):
-    """Merge multiple PDF and image files into a single PDF.
 
-    Each image is converted to a single-page PDF and appended in order.
+def _jpeg_dimensions(jpeg_bytes):
+    """Probe (width, height, components) from a JPEG's SOF marker.
 
-    Args:
-        input_files (list[str]): List of input file paths (PDF or images)
-        output_file (str): Output PDF file path
+    Pure byte scan, no decode. Only baseline/extended/progressive frames
+    (SOF0-SOF2) are recognized; returns None for anything else so callers
+    fall back to a full decode path.
     """
-    pdf_writer = PdfWriter()
-    total_input = len(input_files)
-    for file_path in input_files:
-        suffix = Path(file_path).suffix.lower()
+    if not jpeg_bytes.startswith(b"\xff\xd8"):
+        return None
+    i = 2
+    n = len(jpeg_bytes)
+    while i + 9 < n:
+        if jpeg_bytes[i] != 0xFF:
+            i += 1
+            continue
+        marker = jpeg_bytes[i + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            i += 2  # standalone markers carry no length field
+            continue
+        if marker == 0xFF:
+            i += 1  # fill byte
+            continue
+        if marker in (0xC0, 0xC1, 0xC2):
+            height = int.from_bytes(jpeg_bytes[i + 5:i + 7], "big")
+            width = int.from_bytes(jpeg_bytes[i + 7:i + 9], "big")
+            components = jpeg_bytes[i + 9]
+            return width, height, components
+        i += 2 + int.from_bytes(jpeg_bytes[i + 2:i + 4], "big")
+    return None
+
+
+def _jpeg_to_pdf_bytes(jpeg_bytes, width_px, height_px,
+                       page_width_pt=A4_WIDTH_PT, page_height_pt=A4_HEIGHT_PT,
+                       colorspace="/DeviceRGB"):
+    """Wrap an encoded JPEG into a minimal one-page PDF.
+
+    The JPEG stream is embedded verbatim as a DCTDecode image XObject, so
+    photo pages stay JPEG-sized instead of ballooning to a FlateDecode of
+    the raw pixels (and nothing gets re-encoded).
+    """
+    content = f"q {page_width_pt} 0 0 {page_height_pt} 0 0 cm /Im0 Do Q".encode("ascii")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width_pt} {page_height_pt}] "
+         f"/Resources << /XObject << /Im0 4 0 R >> >> /Contents 5 0 R >>").encode("ascii"),
+        (f"<< /Type /XObject /Subtype /Image /Width {width_px} /Height {height_px} "
+         f"/ColorSpace {colorspace} /BitsPerComponent 8 /Filter /DCTDecode "
+         f"/Length {len(jpeg_bytes)} >>").encode("ascii")
+        + b"\nstream\n" + jpeg_bytes + b"\nendstream",
+        f"<< /Length {len(content)} >>".encode("ascii")
+        + b"\nstream\n" + content + b"\nendstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for obj_num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{obj_num} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+    xref_pos = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n".encode("ascii")
+    out += b"0000000000 65535 f \n"
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("ascii")
+    out += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+            f"startxref\n{xref_pos}\n%%EOF\n").encode("ascii")
+    return bytes(out)
+
+
+def _prefetch_input_bytes(file_paths):
+    """Prefetch input files into memory so reads overlap with parsing.
+
+    A first pass issues POSIX_FADV_WILLNEED so the kernel starts pulling
+    every input into the page cache in the background; a small thread pool
+    then reads the bytes (file reads release the GIL). Returns a
+    {path: bytes} mapping; files that fail to read are simply absent and
+    fall back to the normal per-file open path.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        for file_path in file_paths:
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                continue
+
+    def _read(file_path):
         try:
-            print(f"Processing: {file_path}")
-            if suffix == '.pdf':
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PdfReader(file)
-                    for page_num in range(len(pdf_reader.pages)):
-                        pdf_writer.add_page(pdf_reader.pages[page_num])
-                    print(f"  Added {len(pdf_reader.pages)} pages from PDF {file_path}")
-            elif suffix in SUPPORTED_IMAGE_EXTS:
-                if not PIL_AVAILABLE:
-                    print("  Skipped (Pillow not installed)")
-                    continue
-                with Image.open(file_path) as img:
-                    # Convert to RGB (drop alpha) for PDF compatibility
-                    if img.mode in ("RGBA", "P"):
-                        img = img.convert("RGB")
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    prefetched = {}
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(file_paths)))) as pool:
+        for file_path, data in zip(file_paths, pool.map(_read, file_paths)):
+            if data is not None:
+                prefetched[file_path] = data
+    return prefetched
+
+
+def _image_to_pdf_bytes_fitz(file_path, image_size: str = "a4"):
+    """Convert an image to one-page PDF bytes with PyMuPDF.
+
+    The compressed image stream is embedded as-is (no decode/re-encode
+    round-trip); for "a4" the image is scaled and centered on an A4 page
+    at render time, for "original" the page takes the image's native size.
+    """
+    fitz = _fitz()
+    if image_size == "a4":
+        doc = fitz.open()
+        page = doc.new_page(width=A4_WIDTH_PT, height=A4_HEIGHT_PT)
+        page.insert_image(page.rect, filename=file_path, keep_proportion=True)
+        pdf_bytes = doc.tobytes()
+        doc.close()
+        return pdf_bytes
+    src = fitz.open(file_path)
+    pdf_bytes = src.convert_to_pdf()
+    src.close()
+    return pdf_bytes
+
+
+def _image_to_a4_pdf_bytes_vips(file_path):
+    """Render an image onto an A4 page as PDF bytes using pyvips.
+
+    Sequential access streams the source in tiles, so large photos never
+    need a fully decoded in-memory bitmap.
+    """
+    pyvips = _pyvips()
+    vips_img = pyvips.Image.new_from_file(file_path, access="sequential")
+    if vips_img.hasalpha():
+        vips_img = vips_img.flatten(background=[255, 255, 255])
+    scale = min(A4_WIDTH_PX / vips_img.width, A4_HEIGHT_PX / vips_img.height)
+    if scale != 1.0:
+        vips_img = vips_img.resize(scale, kernel="lanczos3")
+    ox = (A4_WIDTH_PX - vips_img.width) // 2
+    oy = (A4_HEIGHT_PX - vips_img.height) // 2
+    vips_img = vips_img.embed(ox, oy, A4_WIDTH_PX, A4_HEIGHT_PX,
+                              extend="background", background=[255, 255, 255])
+    return vips_img.write_to_buffer(".pdf")
+
+
+def _image_to_a4_pdf_bytes_reportlab(file_path):
+    """Render an image centered on an A4 page as PDF bytes via reportlab.
+
+    drawImage scales at render time and keeps the source's compressed
+    stream (DCT for JPEG), so there is no decode/re-encode of the pixels.
+    """
+    rl_canvas, ImageReader = _reportlab()
+    buffer = BytesIO()
+    page = rl_canvas.Canvas(buffer, pagesize=(A4_WIDTH_PT, A4_HEIGHT_PT))
+    img = ImageReader(file_path)
+    width, height = img.getSize()
+    scale = min(A4_WIDTH_PT / width, A4_HEIGHT_PT / height)
+    draw_w, draw_h = width * scale, height * scale
+    page.drawImage(img, (A4_WIDTH_PT - draw_w) / 2, (A4_HEIGHT_PT - draw_h) / 2,
+                   draw_w, draw_h)
+    page.showPage()
+    page.save()
+    return buffer.getvalue()
+
+
+# Per-process NumPy scratch canvas for the OpenCV tier, mirroring the
+# Pillow scratch below: allocated once, and only the previous image's
+# footprint is wiped back to white between pages.
+_cv_canvas = None
+_cv_canvas_dirty = None  # (top, bottom, left, right) of the last paste
+
+
+def _get_cv_canvas(np):
+    global _cv_canvas, _cv_canvas_dirty
+    if _cv_canvas is None:
+        _cv_canvas = np.full((A4_HEIGHT_PX, A4_WIDTH_PX, 3), 255, dtype=np.uint8)
+    elif _cv_canvas_dirty is not None:
+        top, bottom, left, right = _cv_canvas_dirty
+        _cv_canvas[top:bottom, left:right] = 255
+        _cv_canvas_dirty = None
+    return _cv_canvas
+
+
+def _image_to_a4_pdf_bytes_cv2(file_path, image_quality=85):
+    """Render an image onto an A4 page as PDF bytes using OpenCV + NumPy.
+
+    Decode, INTER_AREA resize and JPEG encode all run in OpenCV's SIMD
+    code (releasing the GIL); the center-paste is one vectorized slice
+    assignment into the reused canvas, so there is no per-image Python
+    pixel work at all.
+    """
+    cv2 = _cv2()
+    np = _numpy()
+    img = cv2.imread(file_path, cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("OpenCV could not decode image")
+    height, width = img.shape[:2]
+    scale = min(A4_WIDTH_PX / width, A4_HEIGHT_PX / height)
+    new_w, new_h = max(1, int(width * scale)), max(1, int(height * scale))
+    if (new_w, new_h) != (width, height):
+        img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
+    a4_canvas = _get_cv_canvas(np)
+    left = (A4_WIDTH_PX - new_w) // 2
+    top = (A4_HEIGHT_PX - new_h) // 2
+    a4_canvas[top:top + new_h, left:left + new_w] = img
+    global _cv_canvas_dirty
+    _cv_canvas_dirty = (top, top + new_h, left, left + new_w)
+    ok, encoded = cv2.imencode(".jpg", a4_canvas,
+                               [int(cv2.IMWRITE_JPEG_QUALITY), int(image_quality)])
+    if not ok:
+        raise ValueError("OpenCV could not encode canvas as JPEG")
+    return _jpeg_to_pdf_bytes(encoded.tobytes(), A4_WIDTH_PX, A4_HEIGHT_PX)
+
+
+# Per-process scratch reused by the Pillow path across image pages (the
+# render loop is single-threaded within each process): one ~26 MB A4
+# bitmap and one byte buffer instead of a fresh allocation per image.
+_scratch_canvas = None
+_scratch_canvas_dirty = None  # (left, top, right, bottom) of the last paste
+_scratch_buffer = None
+
+
+def _get_scratch_buffer():
+    """Return the shared BytesIO, emptied for reuse."""
+    global _scratch_buffer
+    if _scratch_buffer is None:
+        _scratch_buffer = BytesIO()
+    else:
+        _scratch_buffer.seek(0)
+        _scratch_buffer.truncate(0)
+    return _scratch_buffer
+
 
-                    buffer = BytesIO()
+def _get_a4_canvas(Image):
+    """Return the shared white A4 canvas.
 
-                    if image_size == "a4":
-                        # Scale image to fit within A4 while preserving aspect ratio
+    Only the rectangle the previous image covered is wiped back to white,
+    not the whole 2480x3508 bitmap.
+    """
+    global _scratch_canvas, _scratch_canvas_dirty
+    if _scratch_canvas is None:
+        _scratch_canvas = Image.new("RGB", (A4_WIDTH_PX, A4_HEIGHT_PX), "white")
+    elif _scratch_canvas_dirty is not None:
+        _scratch_canvas.paste((255, 255, 255), _scratch_canvas_dirty)
+        _scratch_canvas_dirty = None
+    return _scratch_canvas
+
+
+def _mark_canvas_dirty(box):
+    global _scratch_canvas_dirty
+    _scratch_canvas_dirty = box
+
+
+def _render_to_pdf_bytes(file_path, kind=None, image_size: str = "a4", data=None,
+                         image_quality=85, use_mmap=False):
+    """Render one input file to single-file PDF bytes.
+
+    PDFs are read as-is; images are converted to a one-page PDF (A4 or
+    original size). This is a pure per-file function so it can run in a
+    worker process. Returns None if the file is skipped or fails.
+
+    Args:
+        file_path (str): Input file path (PDF or image)
+        kind (str | None): Pre-classified kind from _classify, or None to
+            classify here
+        image_size (str): "a4" to resize & center images on A4, "original"
+            to keep the native image resolution
+        data (bytes | None): Prefetched file contents for PDF inputs
+        image_quality (int | str): JPEG quality for rasterized image pages,
+            or "lossless" to keep Pillow's PDF encoding
+        use_mmap (bool): Memory-map PDF inputs instead of copying them into
+            a bytes object (only valid in-process; mmap objects don't pickle)
+
+    Returns:
+        bytes | mmap.mmap | None: The rendered single-file PDF, or None if skipped
+    """
+    if kind is None:
+        kind, _ = _classify(file_path)
+    try:
+        if kind == "pdf":
+            if data is not None:
+                return data
+            with open(file_path, 'rb') as file:
+                if use_mmap:
+                    try:
+                        # The mapping outlives the fd; PdfReader's seeks
+                        # become pointer moves and pages stay kernel-backed
+                        # instead of being copied into a Python bytes.
+                        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (OSError, ValueError):
+                        pass  # empty file or no mmap support; fall through
+                return file.read()
+        elif kind == "image":
+            if (image_size == "original"
+                    and os.path.splitext(file_path)[1].casefold() in (".jpg", ".jpeg")):
+                # JPEG at original size: embed the source DCT stream
+                # verbatim (one page pixel per point, like Pillow's
+                # default mapping) - no decode, no re-encode
+                jpeg_bytes = data
+                if jpeg_bytes is None:
+                    with open(file_path, 'rb') as file:
+                        jpeg_bytes = file.read()
+                dims = _jpeg_dimensions(jpeg_bytes)
+                if dims is not None and dims[2] in (1, 3):
+                    width_px, height_px, components = dims
+                    colorspace = "/DeviceGray" if components == 1 else "/DeviceRGB"
+                    return _jpeg_to_pdf_bytes(jpeg_bytes, width_px, height_px,
+                                              page_width_pt=width_px,
+                                              page_height_pt=height_px,
+                                              colorspace=colorspace)
+                # unusual frame type or CMYK: fall through to a full decode
+            if _fitz() is not None:
+                try:
+                    return _image_to_pdf_bytes_fitz(file_path, image_size)
+                except Exception as e:
+                    logger.warning(f"  PyMuPDF failed for {file_path} ({e}), falling back")
+            if image_size == "a4" and _pyvips() is not None:
+                try:
+                    return _image_to_a4_pdf_bytes_vips(file_path)
+                except Exception as e:
+                    logger.warning(f"  pyvips failed for {file_path} ({e}), falling back")
+            if (image_size == "a4" and image_quality != "lossless"
+                    and _cv2() is not None and _numpy() is not None):
+                try:
+                    return _image_to_a4_pdf_bytes_cv2(file_path, image_quality)
+                except Exception as e:
+                    logger.warning(f"  OpenCV failed for {file_path} ({e}), falling back")
+            if image_size == "a4" and _reportlab() is not None:
+                try:
+                    return _image_to_a4_pdf_bytes_reportlab(file_path)
+                except Exception as e:
+                    logger.warning(f"  reportlab failed for {file_path} ({e}), falling back")
+            Image = _pil()
+            if Image is None:
+                logger.warning(f"  Skipped (Pillow not installed): {file_path}")
+                return None
+            with Image.open(file_path) as img:
+                # Convert to RGB (drop alpha) for PDF compatibility
+                if img.mode in ("RGBA", "P"):
+                    img = img.convert("RGB")
+
+                buffer = _get_scratch_buffer()
+
+                if image_size == "a4":
+                    if img.width > A4_WIDTH_PX or img.height > A4_HEIGHT_PX:
+                        # draft() lets libjpeg decode at a reduced DCT scale
+                        # when possible; thumbnail() then box-reduces close to
+                        # the target before a single LANCZOS pass - same
+                        # quality as a direct LANCZOS resize at a fraction of
+                        # the cost for big camera JPEGs
+                        img.draft("RGB", (A4_WIDTH_PX, A4_HEIGHT_PX))
+                        img.thumbnail((A4_WIDTH_PX, A4_HEIGHT_PX),
+                                      Image.Resampling.LANCZOS, reducing_gap=3.0)
+                    else:
+                        # thumbnail() never upscales, so small images keep the
+                        # original scale-to-fit resize
                         scale = min(A4_WIDTH_PX / img.width, A4_HEIGHT_PX / img.height)
                         new_size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
                         if new_size != (img.width, img.height):
                             img = img.resize(new_size, Image.Resampling.LANCZOS)
 
-                        # Create A4 white canvas and center the image
-                        a4_canvas = Image.new("RGB", (A4_WIDTH_PX, A4_HEIGHT_PX), "white")
-                        offset = ((A4_WIDTH_PX - img.width) // 2, (A4_HEIGHT_PX - img.height) // 2)
-                        a4_canvas.paste(img, offset)
+                    # Center the image on the shared white A4 canvas
+                    a4_canvas = _get_a4_canvas(Image)
+                    offset = ((A4_WIDTH_PX - img.width) // 2, (A4_HEIGHT_PX - img.height) // 2)
+                    a4_canvas.paste(img, offset)
+                    _mark_canvas_dirty((offset[0], offset[1],
+                                        offset[0] + img.width, offset[1] + img.height))
 
+                    if image_quality == "lossless":
                         a4_canvas.save(buffer, format="PDF", resolution=A4_DPI)
-                        buffer.seek(0)
-                        img_pdf = PdfReader(buffer)
-                        pdf_writer.add_page(img_pdf.pages[0])
-                        print(f"  Converted image to A4 PDF page: {file_path} (placed at {img.width}x{img.height} within A4)")
-                    else:  # original
-                        # Save the image directly as a single-page PDF at its native pixel size.
-                        # Note: PDF uses points; Pillow handles mapping. Large images may create large pages.
-                        img.save(buffer, format="PDF")
-                        buffer.seek(0)
-                        img_pdf = PdfReader(buffer)
-                        pdf_writer.add_page(img_pdf.pages[0])
-                        print(f"  Added image at original resolution as PDF page: {file_path} ({img.width}x{img.height}px)")
-            else:
-                print(f"  Skipped unsupported file type: {file_path}")
+                    else:
+                        # JPEG (DCTDecode) keeps photo pages small; Pillow's
+                        # PDF encoder would flate-compress the raw canvas
+                        a4_canvas.save(buffer, format="JPEG",
+                                       quality=image_quality, optimize=True)
+                        return _jpeg_to_pdf_bytes(buffer.getvalue(),
+                                                  A4_WIDTH_PX, A4_HEIGHT_PX)
+                else:  # original
+                    # Save the image directly as a single-page PDF at its native pixel size.
+                    # Note: PDF uses points; Pillow handles mapping. Large images may create large pages.
+                    img.save(buffer, format="PDF")
+                return buffer.getvalue()
+        else:
+            logger.warning(f"  Skipped unsupported file type: {file_path}")
+            return None
+    except Exception as e:
+        logger.error(f"Error processing {file_path}: {e}")
+        return None
+
+
+def merge_pdfs_and_images(input_files, output_file, image_size: str = "a4", jobs: int = 1,
+                          io_backend: str = "sync", image_quality=85):
+    """Merge multiple PDF and image files into a single PDF.
+
+    Each image is converted to a single-page PDF and appended in order.
+    With jobs > 1 the per-file rendering (PDF read, image decode/resize/
+    encode) runs in a process pool; the final page append stays in this
+    process because PdfWriter is not thread-safe.
+
+    Args:
+        input_files (list[tuple[str, str]]): (path, kind) pairs as returned
+            by validate_input_files / validate_gui_files
+        output_file (str): Output PDF file path
+        image_size (str): "a4" (default) or "original" image placement
+        jobs (int): Worker processes for rendering (0 = one per CPU core)
+        io_backend (str): "sync" (default) reads each input on demand,
+            "prefetch" overlaps all input reads with parsing
+        image_quality (int | str): JPEG quality for rasterized image
+            pages, or "lossless"
+    """
+    if len(input_files) == 1 and input_files[0][1] == "pdf":
+        # A single PDF needs no parse/rewrite: a byte copy is orders of
+        # magnitude faster (shutil uses sendfile & friends) and preserves
+        # the original compression and object streams exactly.
+        file_path = input_files[0][0]
+        logger.info(f"Processing: {file_path}")
+        try:
+            shutil.copyfile(file_path, output_file)
         except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-            continue
+            logger.error(f"Error writing output file {output_file}: {e}")
+            sys.exit(1)
+        logger.info(f"\nSuccessfully merged 1 file(s) into: {output_file}")
+        return
+
+    fitz = _fitz()
+    if fitz is not None:
+        out_doc = fitz.open()
+        pdf_writer = None
+    else:
+        pypdf2 = _pypdf2()
+        if pypdf2 is None:
+            logger.error("Error: PyMuPDF or PyPDF2 is required. Install with: pip install PyMuPDF")
+            sys.exit(1)
+        out_doc = None
+        pdf_writer = pypdf2.PdfWriter()
+    # source readers must stay alive until pdf_writer.write() resolves
+    # their shared indirect references
+    readers = []
+    total_input = len(input_files)
+    total_pages = 0
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    paths = [file_path for file_path, _ in input_files]
+    kinds = [kind for _, kind in input_files]
+    render = partial(_render_to_pdf_bytes, image_size=image_size, image_quality=image_quality)
+    if jobs > 1 and total_input > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_configure_logging)
+        # executor.map preserves input order
+        rendered = executor.map(render, paths, kinds)
+    else:
+        executor = None
+        if pdf_writer is not None:
+            # mmap only pays off for PyPDF2's many small in-process
+            # seeks/reads; PyMuPDF parses natively from bytes anyway
+            render = partial(render, use_mmap=True)
+        if io_backend == "prefetch" and total_input > 1:
+            prefetched = _prefetch_input_bytes(paths)
+            rendered = (render(f, k, data=prefetched.get(f)) for f, k in input_files)
+        else:
+            rendered = map(render, paths, kinds)
+
+    try:
+        for (file_path, kind), pdf_bytes in zip(input_files, rendered):
+            logger.info(f"Processing: {file_path}")
+            if pdf_bytes is None:
+                continue
+            try:
+                if out_doc is not None:
+                    src = fitz.open("pdf", pdf_bytes)
+                    n_pages = src.page_count
+                    out_doc.insert_pdf(src)
+                    src.close()
+                else:
+                    # mmap is already a seekable file-like; bytes need wrapping
+                    stream = pdf_bytes if isinstance(pdf_bytes, mmap.mmap) else BytesIO(pdf_bytes)
+                    pdf_reader = pypdf2.PdfReader(stream)
+                    n_pages = len(pdf_reader.pages)
+                    # one bulk call instead of deep-cloning each page
+                    # dictionary through add_page
+                    pdf_writer.append_pages_from_reader(pdf_reader)
+                    readers.append(pdf_reader)
+                total_pages += n_pages
+                if kind == "pdf":
+                    logger.info(f"  Added {n_pages} pages from PDF {file_path}")
+                else:
+                    logger.info(f"  Added image as PDF page ({image_size}): {file_path}")
+            except Exception as e:
+                logger.error(f"Error processing {file_path}: {e}")
+                continue
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-    if len(pdf_writer.pages) == 0:
-        print("Error: No pages were added. Nothing to write.")
+    if total_pages == 0:
+        logger.error("Error: No pages were added. Nothing to write.")
         sys.exit(1)
 
     try:
-        with open(output_file, 'wb') as output:
-            pdf_writer.write(output)
-        print(f"\nSuccessfully merged {total_input} file(s) into: {output_file}")
-        print(f"Total pages in merged PDF: {len(pdf_writer.pages)}")
+        if out_doc is not None:
+            # garbage=4 + deflate drop duplicate objects and recompress
+            # streams, keeping the merged file compact
+            out_doc.save(output_file, garbage=4, deflate=True, clean=True)
+            out_doc.close()
+        else:
+            # 4 MiB buffer instead of the 8 KiB default: ~100x fewer write
+            # syscalls for multi-MB merged outputs
+            with open(output_file, 'wb', buffering=4 * 1024 * 1024) as output:
+                pdf_writer.write(output)
+                output.flush()
+                if hasattr(os, 'posix_fadvise'):
+                    # We never re-read the merged file; tell the kernel not
+                    # to keep it in the page cache.
+                    os.posix_fadvise(output.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        logger.info(f"\nSuccessfully merged {total_input} file(s) into: {output_file}")
+        logger.info(f"Total pages in merged PDF: {total_pages}")
     except Exception as e:
-        print(f"Error writing output file {output_file}: {e}")
+        logger.error(f"Error writing output file {output_file}: {e}")
         sys.exit(1)
 
 
@@ -131,11 +687,13 @@ def select_files_gui():
     Returns:
         tuple: (input_files, output_file) or (None, None) if cancelled
     """
-    if not GUI_AVAILABLE:
-        print("Error: GUI not available. Please provide files as command line arguments.")
-        print("tkinter is required for the file selection dialog.")
+    gui = _tkinter()
+    if gui is None:
+        logger.error("Error: GUI not available. Please provide files as command line arguments.")
+        logger.error("tkinter is required for the file selection dialog.")
         return None, None
-    
+    tk, filedialog, messagebox = gui
+
     # Create a root window but hide it
     root = tk.Tk()
     root.withdraw()
@@ -155,30 +713,19 @@ def select_files_gui():
         )
         
         if not input_files:
-            print("No files selected. Operation cancelled.")
+            logger.info("No files selected. Operation cancelled.")
             return None, None
         
         # Validate that selected files are PDFs or supported images
-        valid_files = []
-        for file_path in input_files:
-            suffix = Path(file_path).suffix.lower()
-            if suffix == '.pdf' or suffix in SUPPORTED_IMAGE_EXTS:
-                if suffix in SUPPORTED_IMAGE_EXTS and not PIL_AVAILABLE:
-                    print(f"Warning: Pillow not installed. Skipping image file: {file_path}")
-                else:
-                    valid_files.append(file_path)
-            else:
-                print(f"Warning: Skipping unsupported file: {file_path}")
+        valid_files = validate_gui_files(input_files)
         
         if not valid_files:
-            if GUI_AVAILABLE:
-                messagebox.showerror("Error", "No valid PDF or image files selected.")
+            messagebox.showerror("Error", "No valid PDF or image files selected.")
             return None, None
         
         # Allow even a single file (user may want to convert an image to PDF)
         if len(valid_files) == 0:
-            if GUI_AVAILABLE:
-                messagebox.showerror("Error", "No valid PDF or image files selected.")
+            messagebox.showerror("Error", "No valid PDF or image files selected.")
             return None, None
         
         # Select output file
@@ -190,44 +737,83 @@ def select_files_gui():
         )
         
         if not output_file:
-            print("No output file specified. Operation cancelled.")
+            logger.info("No output file specified. Operation cancelled.")
             return None, None
 
         return valid_files, output_file
         
     except Exception as e:
-        print(f"Error in file selection: {e}")
+        logger.error(f"Error in file selection: {e}")
         return None, None
     finally:
         root.destroy()
 
 
+def validate_gui_files(file_paths):
+    """Classify files picked in the selection dialog.
+
+    The dialog guarantees the files exist, so only extension
+    classification is needed.
+
+    Args:
+        file_paths (list[str]): Selected file paths
+
+    Returns:
+        list[tuple[str, str]]: (path, kind) pairs for usable files
+    """
+    valid_files = []
+    for file_path in file_paths:
+        kind, _ = _classify(file_path)
+        if kind == "skip":
+            logger.warning(f"Warning: Skipping unsupported file: {file_path}")
+        elif kind == "image" and _pil() is None:
+            logger.warning(f"Warning: Pillow not installed. Skipping image file: {file_path}")
+        else:
+            valid_files.append((file_path, kind))
+    return valid_files
+
+
 def validate_input_files(file_paths):
     """Validate input files (PDFs or supported images).
 
+    Each path costs a single stat call (exists/is_file answered together);
+    a directory argument is expanded to the supported files directly
+    inside it, sorted by name, with no extra stats thanks to scandir's
+    cached DirEntry results.
+
     Args:
-        file_paths (list[str]): Paths to validate
+        file_paths (list[str]): File or directory paths to validate
 
     Returns:
-        list[str]: Valid file paths
+        list[tuple[str, str]]: (path, kind) pairs for valid files
     """
     valid_files = []
     for file_path in file_paths:
-        path = Path(file_path)
-        if not path.exists():
-            print(f"Warning: File not found: {file_path}")
-            continue
-        if not path.is_file():
-            print(f"Warning: Not a file: {file_path}")
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            logger.warning(f"Warning: File not found: {file_path}")
             continue
-        suffix = path.suffix.lower()
-        if suffix == '.pdf' or suffix in SUPPORTED_IMAGE_EXTS:
-            if suffix in SUPPORTED_IMAGE_EXTS and not PIL_AVAILABLE:
-                print(f"Warning: Pillow not installed. Skipping image: {file_path}")
-                continue
-            valid_files.append(str(path))
+        if stat.S_ISDIR(st.st_mode):
+            with os.scandir(file_path) as entries:
+                candidates = sorted(entry.path for entry in entries if entry.is_file())
+            from_dir = True
+        elif stat.S_ISREG(st.st_mode):
+            candidates = [file_path]
+            from_dir = False
         else:
-            print(f"Warning: Unsupported file type: {file_path}")
+            logger.warning(f"Warning: Not a file: {file_path}")
+            continue
+        for candidate in candidates:
+            kind, _ = _classify(candidate)
+            if kind != "skip":
+                if kind == "image" and _pil() is None:
+                    logger.warning(f"Warning: Pillow not installed. Skipping image: {candidate}")
+                    continue
+                valid_files.append((candidate, kind))
+            elif not from_dir:
+                # only warn for explicitly listed files, not directory noise
+                logger.warning(f"Warning: Unsupported file type: {candidate}")
     return valid_files
 
 
@@ -247,7 +833,7 @@ Examples:
     parser.add_argument(
         'input_files',
         nargs='*',
-    help='PDF/image files to merge (if not provided, a file selection dialog will open)'
+    help='PDF/image files or directories to merge (if not provided, a file selection dialog will open)'
     )
     
     parser.add_argument(
@@ -262,18 +848,48 @@ Examples:
         help='Verbose output'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for per-file rendering (default: 1, 0 = one per CPU core)'
+    )
+
+    parser.add_argument(
+        '--io-backend',
+        choices=['sync', 'prefetch'],
+        default='sync',
+        help='Input read strategy: sync (default) or prefetch (overlap all input reads with parsing)'
+    )
+
     parser.add_argument(
         '--image-size',
         choices=['a4', 'original'],
         default='a4',
         help='How to place images: a4 (default, resize & center on A4) or original (keep original resolution)'
     )
+
+    parser.add_argument(
+        '--image-quality',
+        default='85',
+        help='JPEG quality (1-95) for rasterized image pages, or "lossless" (default: 85)'
+    )
     
     args = parser.parse_args()
-    
+
+    _configure_logging(args.verbose)
+
+    if args.image_quality != 'lossless':
+        try:
+            args.image_quality = int(args.image_quality)
+        except ValueError:
+            parser.error('--image-quality must be an integer (1-95) or "lossless"')
+        if not 1 <= args.image_quality <= 95:
+            parser.error('--image-quality must be in the range 1-95')
+
     # If no input files provided, use GUI file selection
     if not args.input_files:
-        print("No files provided. Opening file selection dialog...")
+        logger.info("No files provided. Opening file selection dialog...")
         selected_files, output_file = select_files_gui()
         if selected_files is None:
             sys.exit(0)
@@ -284,26 +900,28 @@ Examples:
         valid_files = validate_input_files(args.input_files)
         output_filename = args.output
         if not valid_files:
-            print("Error: No valid PDF or image files provided")
+            logger.error("Error: No valid PDF or image files provided")
             sys.exit(1)
         
         # Check if output file already exists
         if os.path.exists(output_filename):
             response = input(f"Output file '{output_filename}' already exists. Overwrite? (y/N): ")
             if response.lower() not in ['y', 'yes']:
-                print("Operation cancelled.")
+                logger.info("Operation cancelled.")
                 sys.exit(0)
     
     if args.verbose:
-        print(f"Input files: {valid_files}")
-        print(f"Output file: {output_filename}")
-        print()
-    
-    # Merge the PDFs & images
-    if any(Path(f).suffix.lower() in SUPPORTED_IMAGE_EXTS for f in valid_files) and not PIL_AVAILABLE:
-        print("Error: Image files supplied but Pillow is not installed. Install with: pip install Pillow")
+        logger.info(f"Input files: {[file_path for file_path, _ in valid_files]}")
+        logger.info(f"Output file: {output_filename}")
+        logger.info("")
+
+    # Merge the PDFs & images (inputs are already classified; no re-scan)
+    has_images = any(kind == "image" for _, kind in valid_files)
+    if has_images and _pil() is None:
+        logger.error("Error: Image files supplied but Pillow is not installed. Install with: pip install Pillow")
         sys.exit(1)
-    merge_pdfs_and_images(valid_files, output_filename, image_size=args.image_size)
+    merge_pdfs_and_images(valid_files, output_filename, image_size=args.image_size, jobs=args.jobs,
+                          io_backend=args.io_backend, image_quality=args.image_quality)
 
 
 if __name__ == '__main__':